@@ -3,9 +3,15 @@ import pandas as pd
 import datetime
 import math
 import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 import plotly.express as px
 import plotly.graph_objects as go
+from streamlit.logger import get_logger
+
+logger = get_logger(__name__)
 
 # Page configuration
 st.set_page_config(
@@ -108,7 +114,19 @@ ISLAMIC_CALENDAR_MONTHS = [
     "Ramadan", "Shawwal", "Dhu al-Qi'da", "Dhu al-Hijja"
 ]
 
+KAABA_LAT = 21.4225
+KAABA_LON = 39.8262
+
+# Cache warm-up: the chart figures are built in the background by the first session
+# after the server boots so later sessions hit a warm cache. There is no per-location
+# or per-date warm-up: PRAYER_TIMES and the Hijri date are static sample data, and a
+# Qibla bearing and compass are cheaper to compute than to load from st.cache_data.
+# Once the data becomes dated or location-specific, extend start_cache_warmup().
+WARMUP_WORKERS = 2
+
 def main():
+    start_cache_warmup()
+
     # Header
     st.markdown("""
     <div class="main-header">
@@ -214,8 +232,7 @@ def prayer_times():
     
     # Prayer time chart
     st.subheader("📊 Prayer Times Visualization")
-    prayer_df = pd.DataFrame(list(PRAYER_TIMES.items()), columns=['Prayer', 'Time'])
-    fig = px.bar(prayer_df, x='Prayer', y='Time', title="Daily Prayer Schedule")
+    fig = build_prayer_times_chart()
     st.plotly_chart(fig, use_container_width=True)
 
 def daily_quran():
@@ -319,13 +336,7 @@ def islamic_calendar():
     
     # Islamic months
     st.subheader("📅 Islamic Months")
-    months_df = pd.DataFrame({
-        'Month': ISLAMIC_CALENDAR_MONTHS,
-        'Order': range(1, 13)
-    })
-    
-    fig = px.bar(months_df, x='Order', y='Month', orientation='h', 
-                 title="Islamic Calendar Months")
+    fig = build_islamic_months_chart()
     st.plotly_chart(fig, use_container_width=True)
     
     # Important Islamic dates
@@ -352,32 +363,12 @@ def qibla_direction():
         lon = st.number_input("Your Longitude", value=55.2708, format="%.4f")
     
     # Calculate Qibla direction (simplified calculation)
-    kaaba_lat = 21.4225
-    kaaba_lon = 39.8262
-    
-    qibla_bearing = calculate_qibla_direction(lat, lon, kaaba_lat, kaaba_lon)
+    qibla_bearing = calculate_qibla_direction(lat, lon, KAABA_LAT, KAABA_LON)
     
     st.success(f"🧭 Qibla Direction: {qibla_bearing:.1f}° from North")
     
     # Compass visualization
-    fig = go.Figure()
-    fig.add_trace(go.Scatterpolar(
-        r=[1, 1],
-        theta=[0, qibla_bearing],
-        mode='lines+markers',
-        name='Qibla Direction',
-        line=dict(color='green', width=5),
-        marker=dict(size=10)
-    ))
-    
-    fig.update_layout(
-        polar=dict(
-            radialaxis=dict(visible=False),
-            angularaxis=dict(direction='clockwise', theta0=90)
-        ),
-        title="Qibla Compass",
-        showlegend=True
-    )
+    fig = build_qibla_compass(qibla_bearing)
     
     st.plotly_chart(fig, use_container_width=True)
     
@@ -610,6 +601,89 @@ def prayer_tracker():
     monthly_completion = (sum(st.session_state.prayer_tracker[today].values()) / 5) * 100
     st.metric("Today's Completion Rate", f"{monthly_completion:.0f}%")
 
+# Chart builders
+@st.cache_data(show_spinner=False)
+def build_prayer_times_chart():
+    prayer_df = pd.DataFrame(list(PRAYER_TIMES.items()), columns=['Prayer', 'Time'])
+    return px.bar(prayer_df, x='Prayer', y='Time', title="Daily Prayer Schedule")
+
+@st.cache_data(show_spinner=False)
+def build_islamic_months_chart():
+    months_df = pd.DataFrame({
+        'Month': ISLAMIC_CALENDAR_MONTHS,
+        'Order': range(1, 13)
+    })
+    
+    return px.bar(months_df, x='Order', y='Month', orientation='h', 
+                  title="Islamic Calendar Months")
+
+def build_qibla_compass(qibla_bearing):
+    fig = go.Figure()
+    fig.add_trace(go.Scatterpolar(
+        r=[1, 1],
+        theta=[0, qibla_bearing],
+        mode='lines+markers',
+        name='Qibla Direction',
+        line=dict(color='green', width=5),
+        marker=dict(size=10)
+    ))
+    
+    fig.update_layout(
+        polar=dict(
+            radialaxis=dict(visible=False),
+            angularaxis=dict(direction='clockwise', rotation=90)
+        ),
+        title="Qibla Compass",
+        showlegend=True
+    )
+    
+    return fig
+
+# Cache warm-up
+@st.cache_resource(show_spinner=False)
+def start_cache_warmup():
+    """Start warming the chart caches on a background pool, once per server process"""
+    tasks = [build_prayer_times_chart, build_islamic_months_chart]
+    
+    status = {
+        "total": len(tasks),
+        "completed": 0,
+        "failed": 0,
+        "started_at": time.time(),
+        "finished_at": None,
+        "lock": threading.Lock()
+    }
+    task_names = {}
+    
+    def on_done(future):
+        error = future.exception()
+        if error is not None:
+            logger.error("Cache warm-up task %s failed", task_names[future], exc_info=error)
+        with status["lock"]:
+            if error is None:
+                status["completed"] += 1
+            else:
+                status["failed"] += 1
+            if status["completed"] + status["failed"] < status["total"]:
+                return
+            status["finished_at"] = time.time()
+            completed, failed = status["completed"], status["failed"]
+            elapsed = status["finished_at"] - status["started_at"]
+        logger.info(
+            "Cache warm-up finished: %d/%d tasks cached, %d failed, in %.2fs",
+            completed, status["total"], failed, elapsed
+        )
+    
+    # Threads rather than processes so results land in this process's st.cache_data
+    executor = ThreadPoolExecutor(max_workers=WARMUP_WORKERS, thread_name_prefix="cache-warmup")
+    for task in tasks:
+        future = executor.submit(task)
+        task_names[future] = task.__name__
+        future.add_done_callback(on_done)
+    executor.shutdown(wait=False)
+    
+    return status
+
 # Helper functions
 def get_next_prayer():
     current_time = datetime.now().time()
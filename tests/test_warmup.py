@@ -0,0 +1,64 @@
+import logging
+import time
+from pathlib import Path
+
+import streamlit as st
+from streamlit.testing.v1 import AppTest
+
+APP_PATH = str(Path(__file__).resolve().parent.parent / "app.py")
+
+
+class RecordingHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+def new_session():
+    return AppTest.from_file(APP_PATH, default_timeout=30)
+
+
+def timed_render(at, page):
+    start = time.perf_counter()
+    at.sidebar.selectbox[0].set_value(page).run()
+    elapsed = time.perf_counter() - start
+    assert not at.exception
+    return elapsed
+
+
+def wait_for_warmup(handler, timeout=60):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        finished = [m for m in handler.messages if m.startswith("Cache warm-up finished")]
+        if finished:
+            return finished[0]
+        time.sleep(0.05)
+    raise AssertionError("cache warm-up did not finish")
+
+
+def test_first_request_after_warmup_matches_steady_state():
+    st.cache_data.clear()
+    st.cache_resource.clear()
+
+    # AppTest runs app.py as __main__, which is the name the app logs under
+    handler = RecordingHandler()
+    app_logger = logging.getLogger("__main__")
+    app_logger.addHandler(handler)
+    try:
+        # The first session starts the warm-up without waiting for it
+        new_session().run()
+        summary = wait_for_warmup(handler)
+    finally:
+        app_logger.removeHandler(handler)
+    assert "2/2 tasks cached, 0 failed" in summary
+
+    # Prayer Times is the first chart rendered in this process, so without the
+    # warm-up it would also pay Plotly's one-off initialisation
+    at = new_session().run()
+    first = timed_render(at, "🕐 Prayer Times")
+    steady = min(timed_render(at, "🕐 Prayer Times") for _ in range(3))
+    # Same order as a repeat render, with slack for scheduler noise
+    assert first <= steady * 1.5 + 0.02, (first, steady)